@@ -41,6 +41,12 @@ class Settings:
     max_file_size: int = 5 * 1024 * 1024   # 5 MB — resumes are tiny documents
     max_resume_pages: int = 2               # hard page cap to prevent abuse
 
+    # On-disk result cache (extraction and analysis). Defaults to a private
+    # directory under the system temp dir; on Cloud Run /tmp is in-memory, so
+    # the entry count is capped. Set RESUME_CACHE_MAX_ENTRIES=0 to disable.
+    resume_cache_dir: str = os.getenv("RESUME_CACHE_DIR", "")
+    resume_cache_max_entries: int = int(os.getenv("RESUME_CACHE_MAX_ENTRIES", "256"))
+
     # OpenAI configuration — strip to remove any trailing newline injected by Secret Manager
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "").strip()
     openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
@@ -4,13 +4,13 @@ AnalyzeController module for handling resume analysis endpoints.
 import logging
 import json
 from io import BytesIO
-from typing import Dict, Any, List
-from fastapi import HTTPException, UploadFile, File
+from typing import Dict, Any, List, Optional
+from fastapi import BackgroundTasks, HTTPException, UploadFile, File
 from pydantic import BaseModel, field_validator
 import PyPDF2
 
 from ..config import settings
-from ..services.analysis_service import extract_text_from_pdf, analyze_resume_against_job, generate_optimized_resume, generate_cover_letter, scan_job_red_flags, generate_interview_questions, evaluate_interview_answer, _condense_job_description
+from ..services.analysis_service import extract_text_from_pdf, save_extracted_text, analyze_resume_against_job, generate_optimized_resume, generate_cover_letter, scan_job_red_flags, generate_interview_questions, evaluate_interview_answer, _condense_job_description, _get_async_openai_client, _loads
 
 # Maximum character limits for text inputs to prevent abuse and unbounded OpenAI costs
 _MAX_RESUME_TEXT = 50_000   # ~25 pages of dense text
@@ -195,8 +195,16 @@ class AnalyzeController:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
-    async def extract_text_from_resume(self, resume: UploadFile = File(...)) -> Dict[str, Any]:
-        """Extract text from uploaded PDF resume."""
+    async def extract_text_from_resume(
+        self,
+        resume: UploadFile = File(...),
+        background_tasks: Optional[BackgroundTasks] = None,
+    ) -> Dict[str, Any]:
+        """
+        Extract text from uploaded PDF resume.
+        When background_tasks is provided, the extracted text is saved to disk
+        after the response has been sent instead of blocking it.
+        """
         try:
             # Validate file type by extension
             if not resume.filename:
@@ -247,6 +255,9 @@ class AnalyzeController:
 
             extracted_data = await extract_text_from_pdf(resume_content)
 
+            if background_tasks is not None:
+                background_tasks.add_task(save_extracted_text, extracted_data["text"])
+
             response_data = {
                 "success": True,
                 "filename": resume.filename,
@@ -361,8 +372,7 @@ class AnalyzeController:
             if not settings.openai_api_key:
                 raise HTTPException(status_code=500, detail="Service configuration error. Please contact support.")
 
-            from openai import AsyncOpenAI
-            client = AsyncOpenAI(api_key=settings.openai_api_key)
+            client = _get_async_openai_client()
 
             self.logger.info("Extracting job data via server-side OpenAI call...")
 
@@ -412,7 +422,7 @@ class AnalyzeController:
             raw = raw.strip()
 
             try:
-                job_data = json.loads(raw)
+                job_data = _loads(raw)
             except json.JSONDecodeError:
                 self.logger.error("Failed to parse OpenAI response as JSON")
                 raise HTTPException(status_code=500, detail="AI response could not be parsed as JSON")
@@ -6,11 +6,12 @@ import xml.etree.ElementTree as ET
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import httpx
-from fastapi import APIRouter, File, Request, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, BackgroundTasks, File, Request, UploadFile
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from ..dependencies import AnalyzeControllerDep
 from ..controllers.AnalyzeController import KeywordAnalysisRequest, ResumeOptimizationRequest, ExtractJobRequest, CoverLetterRequest, RedFlagScanRequest, MockInterviewRequest, EvaluateAnswerRequest
+from ..services.analysis_service import _dumps
 from ..config import settings
 from ..limiter import limiter
 
@@ -82,15 +83,24 @@ async def contact_form_endpoint(body: ContactFormRequest):
         )
 
 
+def _json_bytes_response(content: dict) -> Response:
+    """
+    Serialize a large payload (full resume text) straight to UTF-8 JSON bytes,
+    skipping FastAPI's jsonable_encoder copy and second encoding pass.
+    """
+    return Response(content=_dumps(content), media_type="application/json")
+
+
 @analyze_router.post("/extract-text")
 @limiter.limit("10/minute")
 async def extract_text_endpoint(
     request: Request,
+    background_tasks: BackgroundTasks,
     resume: UploadFile = File(...),
     controller: AnalyzeControllerDep = None
 ):
     """Extract text from an uploaded PDF resume."""
-    return await controller.extract_text_from_resume(resume)
+    return _json_bytes_response(await controller.extract_text_from_resume(resume, background_tasks))
 
 
 @analyze_router.get("/health")
@@ -118,7 +128,7 @@ async def optimize_resume_endpoint(
     controller: AnalyzeControllerDep = None
 ):
     """Generate an ATS-optimized resume based on selected keywords."""
-    return await controller.optimize_resume(body)
+    return _json_bytes_response(await controller.optimize_resume(body))
 
 
 @analyze_router.post("/extract-job")
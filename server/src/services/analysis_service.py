@@ -1,52 +1,228 @@
 import os
 import re
-import json
+import asyncio
 import tempfile
 import hashlib
+import itertools
+import json
+import logging
+import shutil
+import stat
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Any, Set, Tuple
 from io import BytesIO
 
+import ahocorasick
+try:
+    import orjson
+except ImportError:  # optional fast JSON codec; the stdlib json module is the fallback
+    orjson = None
 import PyPDF2
-from pdf2image import convert_from_bytes
+import pypdfium2 as pdfium
+from pdf2image import convert_from_bytes, pdfinfo_from_bytes
 import pytesseract
-from openai import OpenAI
+try:
+    import tesserocr
+except ImportError:  # optional in-process OCR; pytesseract is the fallback
+    tesserocr = None
+from openai import AsyncOpenAI, OpenAI
 import httpx
 
 from ..config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# JSON codec: orjson parses large LLM responses several times faster. Its
+# JSONDecodeError subclasses json.JSONDecodeError, so callers catch the latter
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
 
 # =========================================================
 # ---------------- OPENAI CLIENT FACTORY ------------------
 # =========================================================
 
+# Explicit timeouts are required for Google Cloud Run (serverless) where
+# default connection settings can cause silent 'Connection error.' failures.
+_OPENAI_TIMEOUT = httpx.Timeout(
+    connect=10.0,    # seconds to establish connection
+    read=120.0,      # seconds to wait for response data
+    write=10.0,      # seconds to send data
+    pool=10.0,       # seconds to wait for a connection from pool
+)
+
+_openai_client: Optional[OpenAI] = None
+_async_openai_client: Optional[AsyncOpenAI] = None
+
+
+def _get_openai_api_key() -> str:
+    """API key is stripped to remove any trailing newline injected by Secret Manager."""
+    return (settings.openai_api_key or os.getenv("OPENAI_API_KEY", "")).strip()
+
+
 def _get_openai_client() -> OpenAI:
     """
-    Return a shared OpenAI client configured with explicit timeouts.
-    This is required for Google Cloud Run (serverless) where default
-    connection settings can cause silent 'Connection error.' failures.
-    API key is stripped to remove any trailing newline injected by Secret Manager.
+    Return the process-wide OpenAI client configured with explicit timeouts,
+    creating it on first use so connections and TLS sessions are reused.
     """
-    api_key = (settings.openai_api_key or os.getenv("OPENAI_API_KEY", "")).strip()
-    return OpenAI(
-        api_key=api_key,
-        timeout=httpx.Timeout(
-            connect=10.0,    # seconds to establish connection
-            read=120.0,      # seconds to wait for response data
-            write=10.0,      # seconds to send data
-            pool=10.0,       # seconds to wait for a connection from pool
-        ),
-        max_retries=2,
-    )
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = OpenAI(
+            api_key=_get_openai_api_key(),
+            timeout=_OPENAI_TIMEOUT,
+            max_retries=2,
+        )
+    return _openai_client
+
+
+def _get_async_openai_client() -> AsyncOpenAI:
+    """
+    Return the process-wide AsyncOpenAI client, creating it on first use.
+    Awaiting its calls lets the event loop serve other requests during the
+    round-trip, and reusing it keeps the HTTP connection pool warm.
+    """
+    global _async_openai_client
+    if _async_openai_client is None:
+        _async_openai_client = AsyncOpenAI(
+            api_key=_get_openai_api_key(),
+            timeout=_OPENAI_TIMEOUT,
+            max_retries=2,
+        )
+    return _async_openai_client
 
 
 # =========================================================
 # ---------------- ANALYSIS CACHE -------------------------
 # =========================================================
 
-# In-memory cache for analysis results
-_analysis_cache: Dict[str, Dict[str, Any]] = {}
-_keyword_filter_cache: Dict[str, Dict[str, Any]] = {}
+# In-memory LRU caches for analysis results, bounded so a long-running
+# worker does not grow without limit
+_CACHE_MAX_ENTRIES = 1024
+_analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_keyword_filter_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _cache_get(cache: "OrderedDict[str, Any]", key: str) -> Optional[Any]:
+    """
+    Return the cached value for key (marking it most recently used), or None.
+    """
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: "OrderedDict[str, Any]", key: str, value: Any) -> None:
+    """
+    Store value under key, evicting the least recently used entries once
+    the cache exceeds _CACHE_MAX_ENTRIES.
+    """
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+# On-disk cache shared across workers and restarts, so re-uploading the same
+# resume skips OCR and the OpenAI round-trips. Entries hold resume text, so
+# they live in a directory only this user can read, and the oldest entries
+# are evicted once there are more than _DISK_CACHE_MAX_ENTRIES
+_CACHE_DIR = (Path(settings.resume_cache_dir) if settings.resume_cache_dir
+              else Path(tempfile.gettempdir()) / "resume_cache")
+_CACHE_FILE_FMT = "%s.json"
+_DISK_CACHE_MAX_ENTRIES = settings.resume_cache_max_entries
+
+
+@lru_cache(maxsize=None)
+def _private_cache_dir(path: Path) -> Optional[Path]:
+    """
+    Create path as a directory readable only by the current user and return
+    it. Returns None (disabling the cache) if path already exists but is not
+    a directory owned by this user, e.g. one planted in a shared temp dir.
+    A failed mkdir raises and is not cached, so it is retried on next use.
+    """
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = os.lstat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return None
+    os.chmod(path, 0o700)
+    return path
+
+
+def _disk_cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Return the value stored on disk under key, or None if absent or unreadable.
+    Blocking; call through asyncio.to_thread from async code.
+    """
+    if _DISK_CACHE_MAX_ENTRIES <= 0:
+        return None
+    try:
+        cache_dir = _private_cache_dir(_CACHE_DIR)
+        if cache_dir is None:
+            return None
+        return _loads((cache_dir / (_CACHE_FILE_FMT % key)).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _disk_cache_put(key: str, value: Dict[str, Any]) -> None:
+    """
+    Store value on disk under key (mode 0600, written atomically), then evict
+    the oldest entries beyond _DISK_CACHE_MAX_ENTRIES. Failures are ignored
+    since the cache is only an optimization.
+    Blocking; call through asyncio.to_thread from async code.
+    """
+    if _DISK_CACHE_MAX_ENTRIES <= 0:
+        return
+    try:
+        cache_dir = _private_cache_dir(_CACHE_DIR)
+        if cache_dir is None:
+            return
+        data = _dumps(value)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            try:
+                _write_all(fd, data)
+            finally:
+                os.close(fd)
+            os.replace(tmp_name, cache_dir / (_CACHE_FILE_FMT % key))
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        _evict_disk_cache(cache_dir)
+    except (OSError, TypeError):
+        pass
+
+
+def _evict_disk_cache(cache_dir: Path) -> None:
+    """Delete the least recently written entries beyond the size cap."""
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".json"):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                pass  # removed by another worker
+    if len(entries) <= _DISK_CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - _DISK_CACHE_MAX_ENTRIES]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
 
 
 def _generate_cache_key(resume_text: str, job_data: Dict) -> str:
@@ -58,8 +234,8 @@ def _generate_cache_key(resume_text: str, job_data: Dict) -> str:
     job_fields = ["title", "skills", "requirements", "technologies", "tools", "qualifications"]
     job_str = ""
     for field in job_fields:
-        if field in job_data:
-            value = job_data[field]
+        value = job_data.get(field)
+        if value is not None:
             if isinstance(value, list):
                 # Sort list items for consistency
                 job_str += f"{field}:" + ",".join(sorted([str(v) for v in value]))
@@ -76,9 +252,10 @@ def _generate_cache_key(resume_text: str, job_data: Dict) -> str:
 def _generate_keyword_cache_key(missing_phrases: List[str], job_title: str) -> str:
     """
     Generate cache key for keyword filtering.
+    Only the phrases that are actually sent to the AI are part of the key.
     """
     # Sort phrases for consistency
-    sorted_phrases = sorted(missing_phrases)
+    sorted_phrases = sorted(missing_phrases[:_MAX_KEYWORDS_FOR_AI])
     combined = f"{job_title}|||{','.join(sorted_phrases)}"
     return hashlib.sha256(combined.encode('utf-8')).hexdigest()
 
@@ -197,108 +374,246 @@ EXAMPLE 3 - Project Manager:
 # ---------------- PDF EXTRACTION -------------------------
 # =========================================================
 
+_MAX_OCR_PAGES = 5
+_OCR_DPI = 300
+
+# Long-lived pool so per-thread OCR state (see _ocr_image) survives across
+# requests; also bounds OCR concurrency for the whole worker process
+_OCR_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(_MAX_OCR_PAGES, os.cpu_count() or 1),
+    thread_name_prefix="ocr",
+)
+
+# Bounds how many extractions run on worker threads at once so a burst of
+# uploads cannot starve the default executor
+_EXTRACTION_SEMAPHORE = asyncio.Semaphore(os.cpu_count() or 1)
+
+
 async def extract_text_from_pdf(pdf_buffer: bytes) -> Dict[str, Any]:
     """
     Extract text from PDF with fallback to OCR if needed.
     Returns both extracted text and formatting information.
+    Persisting the text to disk is left to the caller so it can run
+    after the response has been sent.
+    The CPU-bound parsing runs on a worker thread to keep the event loop free.
+    Results are cached on disk by the SHA-1 of the PDF bytes.
     """
-    extracted_text = ""
-    formatting_info = {
-        "sections": [],
-        "hasDetectedFormatting": False,
-        "bulletCount": 0
-    }
+    cache_key = f"pdf-{hashlib.sha1(pdf_buffer).hexdigest()}"
+    cached = await asyncio.to_thread(_disk_cache_get, cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        reader = PyPDF2.PdfReader(BytesIO(pdf_buffer))
-
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                extracted_text += page_text + "\n"
-
-        # Normalize text for consistency across extractions
-        extracted_text = _normalize_extracted_text(extracted_text)
-
-        # Normalize bullet points for consistency
-        extracted_text = normalize_bullet_points(extracted_text)
-
-        # Detect resume structure
-        formatting_info["sections"] = detect_resume_sections(extracted_text)
-        formatting_info["hasDetectedFormatting"] = bool(formatting_info["sections"])
-        formatting_info["bulletCount"] = count_bullet_points(extracted_text)
+        async with _EXTRACTION_SEMAPHORE:
+            extracted_text, formatting_info = await asyncio.to_thread(_extract_sync, pdf_buffer)
 
         # Fallback to OCR if extraction failed
         if len(extracted_text.strip()) < 50:
             ocr_text = await extract_text_with_ocr(pdf_buffer)
             if len(ocr_text) > len(extracted_text):
-                extracted_text = _normalize_extracted_text(ocr_text)
-                extracted_text = normalize_bullet_points(extracted_text)
-                formatting_info["sections"] = detect_resume_sections(extracted_text)
-                formatting_info["bulletCount"] = count_bullet_points(extracted_text)
+                async with _EXTRACTION_SEMAPHORE:
+                    extracted_text, ocr_formatting = await asyncio.to_thread(_structure_text, ocr_text)
+                formatting_info["sections"] = ocr_formatting["sections"]
+                formatting_info["bulletCount"] = ocr_formatting["bulletCount"]
 
-        # Save for debugging and reference
-        save_extracted_text_to_file(extracted_text)
-        save_extracted_text_to_project_base(extracted_text)
-
-        return {
+        result = {
             "text": extracted_text,
             "formatting": formatting_info
         }
+        await asyncio.to_thread(_disk_cache_put, cache_key, result)
+        return result
 
     except Exception as e:
         ocr_text = await extract_text_with_ocr(pdf_buffer)
-        ocr_text = _normalize_extracted_text(ocr_text)
-        ocr_text = normalize_bullet_points(ocr_text)
-        formatting_info["bulletCount"] = count_bullet_points(ocr_text)
-        save_extracted_text_to_project_base(ocr_text)
+        async with _EXTRACTION_SEMAPHORE:
+            ocr_text = await asyncio.to_thread(_clean_text, ocr_text)
         return {
             "text": ocr_text,
-            "formatting": formatting_info
+            "formatting": {
+                "sections": [],
+                "hasDetectedFormatting": False,
+                "bulletCount": count_bullet_points(ocr_text)
+            }
         }
 
 
+def _extract_sync(pdf_buffer: bytes) -> Tuple[str, Dict[str, Any]]:
+    """Synchronous text-layer extraction and structure detection."""
+    return _structure_text(_extract_pdf_text_layer(pdf_buffer))
+
+
+def _clean_text(text: str) -> str:
+    """Normalize text and bullet points for consistency across extractions."""
+    return normalize_bullet_points(_normalize_extracted_text(text))
+
+
+def _structure_text(text: str) -> Tuple[str, Dict[str, Any]]:
+    """Clean extracted text and detect its resume structure."""
+    text = _clean_text(text)
+    sections = detect_resume_sections(text)
+    formatting_info = {
+        "sections": sections,
+        "hasDetectedFormatting": bool(sections),
+        "bulletCount": count_bullet_points(text)
+    }
+    return text, formatting_info
+
+
+# PDFium is not thread-safe: no two threads may call into it at the same
+# time, even on different documents. Extraction runs on several worker
+# threads, so every pdfium call goes through this lock
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _extract_pdf_text_layer(pdf_buffer: bytes) -> str:
+    """
+    Extract the embedded text of a PDF, one page per line block.
+    Uses PDFium (pypdfium2) and falls back to the slower pure-Python PyPDF2
+    when PDFium cannot open the document.
+    """
+    with _PDFIUM_LOCK:
+        page_texts = _pdfium_page_texts(pdf_buffer)
+
+    if page_texts is None:
+        reader = PyPDF2.PdfReader(BytesIO(pdf_buffer))
+        page_texts = [page_text for page in reader.pages if (page_text := page.extract_text())]
+
+    return "\n".join(page_texts)
+
+
+def _pdfium_page_texts(pdf_buffer: bytes) -> Optional[List[str]]:
+    """
+    Return the non-empty page texts read by PDFium, or None if PDFium cannot
+    open the document. Callers must hold _PDFIUM_LOCK.
+    """
+    try:
+        pdf = pdfium.PdfDocument(pdf_buffer)
+    except pdfium.PdfiumError:
+        return None
+
+    try:
+        page_texts = []
+        for page in pdf:
+            textpage = page.get_textpage()
+            page_text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            if page_text:
+                page_texts.append(page_text)
+    finally:
+        pdf.close()
+
+    return page_texts
+
+
 async def extract_text_with_ocr(pdf_buffer: bytes) -> str:
     """
     Use OCR to extract text from PDF images.
     Processes up to 5 pages with high DPI for accuracy.
+    Pages are rasterized and OCR'd concurrently on the OCR thread pool;
+    poppler and tesseract release the GIL, so pages overlap on multi-core hosts.
     """
-    images = convert_from_bytes(pdf_buffer, dpi=300)
-    text = ""
+    loop = asyncio.get_running_loop()
+    page_count = await loop.run_in_executor(_OCR_EXECUTOR, _ocr_page_count, pdf_buffer)
 
-    for i, image in enumerate(images[:5]):
-        text += pytesseract.image_to_string(image, config='--psm 6') + "\n"
+    page_texts = await asyncio.gather(*(
+        loop.run_in_executor(_OCR_EXECUTOR, _ocr_page, pdf_buffer, page_number)
+        for page_number in range(1, page_count + 1)
+    ))
+    text = "".join(page_text + "\n" for page_text in page_texts)
 
     return normalize_bullet_points(text)
 
 
+def _ocr_page_count(pdf_buffer: bytes) -> int:
+    """Number of pages to OCR, capped at _MAX_OCR_PAGES."""
+    return min(pdfinfo_from_bytes(pdf_buffer)["Pages"], _MAX_OCR_PAGES)
+
+
+def _ocr_page(pdf_buffer: bytes, page_number: int) -> str:
+    """
+    Rasterize and OCR a single page (1-based).
+    Each worker only holds the page it is processing in memory.
+    """
+    # Grayscale PPM: a third of the RGB pixel data and no PNG compression;
+    # tesseract binarizes the page anyway
+    images = convert_from_bytes(
+        pdf_buffer,
+        dpi=_OCR_DPI,
+        first_page=page_number,
+        last_page=page_number,
+        fmt="ppm",
+        grayscale=True,
+    )
+    return "".join(_ocr_image(image) for image in images)
+
+
+# Per-thread tesserocr API: loading the language model is the expensive part,
+# and a PyTessBaseAPI instance must not be shared between threads
+_tess_local = threading.local()
+_tesserocr_available = tesserocr is not None
+
+
+def _ocr_image(image) -> str:
+    """
+    OCR a single page image.
+    Uses a long-lived in-process tesserocr API when it is installed and can
+    find its language data, otherwise spawns the tesseract CLI via pytesseract.
+    """
+    global _tesserocr_available
+
+    if _tesserocr_available:
+        api = getattr(_tess_local, "api", None)
+        if api is None:
+            try:
+                api = tesserocr.PyTessBaseAPI(lang="eng", psm=tesserocr.PSM.SINGLE_BLOCK)
+            except RuntimeError:
+                # No usable tessdata for the in-process API; stop retrying
+                _tesserocr_available = False
+            else:
+                _tess_local.api = api
+        if api is not None:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+
+    return pytesseract.image_to_string(image, config='--psm 6')
+
+
 # =========================================================
 # ---------------- TEXT NORMALIZATION ---------------------
 # =========================================================
 
+_BULLET_SYMBOLS = '-–—*▪▫■□◆◇➤➔✓✔>\u2022·'
+
+# Every supported bullet style in one pattern: a single match per line
+# instead of trying each style in turn
+_BULLET_RE = re.compile(
+    r'^(\s*)(?:'
+    r'[' + re.escape(_BULLET_SYMBOLS) + r']\s+'   # symbol bullets
+    r'|o\s+(?=[A-Z])'                             # letter "o" used as a bullet
+    r')'
+)
+
+# Characters a bullet line can start with; other lines skip the regex
+_BULLET_FIRST_CHARS = frozenset(_BULLET_SYMBOLS + 'o')
+
+
 def normalize_bullet_points(text: str) -> str:
     """
     Standardize all bullet point styles to '•' for consistency.
     """
-    bullet_patterns = [
-        r'^(\s*)[-–—*▪▫■□◆◇➤➔✓✔>]\s+',
-        r'^(\s*)\u2022\s+',
-        r'^(\s*)·\s+',
-        r'^(\s*)[o]\s+(?=[A-Z])',
-    ]
-
     lines = text.split("\n")
     output = []
 
     for line in lines:
-        modified = False
-        for pattern in bullet_patterns:
-            match = re.match(pattern, line)
-            if match:
-                # Replace with standard bullet
-                line = f"{match.group(1)}• {line[match.end():].strip()}"
-                modified = True
-                break
+        stripped = line.lstrip()
+        if not stripped or stripped[0] not in _BULLET_FIRST_CHARS:
+            output.append(line)
+            continue
+        match = _BULLET_RE.match(line)
+        if match:
+            # Replace with standard bullet
+            line = f"{match.group(1)}• {line[match.end():].strip()}"
         output.append(line)
 
     return "\n".join(output)
@@ -404,36 +719,71 @@ def _normalize_extracted_text(text: str) -> str:
 # ---------------- SECTION DETECTION ---------------------
 # =========================================================
 
+# Common section headers with variations
+_SECTION_HEADERS = (
+    ('summary', ('SUMMARY', 'PROFESSIONAL SUMMARY', 'PROFILE', 'OBJECTIVE', 'CAREER OBJECTIVE')),
+    ('experience', ('EXPERIENCES', 'WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCES', 'EMPLOYMENT HISTORY', 'WORK HISTORY')),
+    ('education', ('EDUCATION', 'ACADEMIC BACKGROUND')),
+    ('skills', ('SKILLS', 'TECHNICAL SKILLS', 'CORE COMPETENCIES', 'EXPERTISE')),
+    ('certifications', ('CERTIFICATIONS', 'CERTIFICATES', 'LICENSES')),
+    ('projects', ('PROJECTS', 'KEY PROJECTS')),
+)
+
+# Letter runs that str.upper() produces from a single ligature character
+# (e.g. "Certiﬁcations"); IGNORECASE alone does not expand these
+_LIGATURE_ALTERNATIVES = {
+    'FFI': 'ﬃ', 'FFL': 'ﬄ', 'FF': 'ﬀ', 'FI': 'ﬁ', 'FL': 'ﬂ', 'SS': 'ß', 'ST': 'ﬅﬆ',
+}
+_LIGATURE_RUN_RE = re.compile('|'.join(_LIGATURE_ALTERNATIVES))
+
+
+def _header_pattern(header: str) -> str:
+    return _LIGATURE_RUN_RE.sub(
+        lambda m: f'(?:{m.group()}|[{_LIGATURE_ALTERNATIVES[m.group()]}])', header
+    )
+
+
+# One named group per section type, anchored to whole (whitespace-padded)
+# lines, so the whole text is scanned in a single finditer pass
+_SECTION_RE = re.compile(
+    r'^[^\S\n]*(?:'
+    + '|'.join(
+        f'(?P<{section_type}>' + '|'.join(map(_header_pattern, headers)) + ')'
+        for section_type, headers in _SECTION_HEADERS
+    )
+    + r')[^\S\n]*$',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
 def detect_resume_sections(text: str) -> List[Dict[str, Any]]:
     """
     Identify major resume sections and their positions.
     """
-    sections = []
-
-    # Common section headers with variations
-    patterns = [
-        (r'^(SUMMARY|PROFESSIONAL SUMMARY|PROFILE|OBJECTIVE|CAREER OBJECTIVE)$', 'summary'),
-        (r'^(EXPERIENCES|WORK EXPERIENCE|PROFESSIONAL EXPERIENCES|EMPLOYMENT HISTORY|WORK HISTORY)$', 'experience'),
-        (r'^(EDUCATION|ACADEMIC BACKGROUND)$', 'education'),
-        (r'^(SKILLS|TECHNICAL SKILLS|CORE COMPETENCIES|EXPERTISE)$', 'skills'),
-        (r'^(CERTIFICATIONS|CERTIFICATES|LICENSES)$', 'certifications'),
-        (r'^(PROJECTS|KEY PROJECTS)$', 'projects'),
+    return [
+        {"name": name, "type": section_type, "lineNumber": line_number}
+        for name, section_type, line_number in _find_resume_sections(text)
     ]
 
-    lines = text.split("\n")
 
-    for i, line in enumerate(lines):
-        stripped = line.strip().upper()
-        for pattern, section_type in patterns:
-            if re.match(pattern, stripped):
-                sections.append({
-                    "name": line.strip(),  # Keep original casing
-                    "type": section_type,
-                    "lineNumber": i
-                })
-                break
+@lru_cache(maxsize=8)
+def _find_resume_sections(text: str) -> Tuple[Tuple[str, str, int], ...]:
+    """
+    Memoized scan behind detect_resume_sections; the same resume is scanned
+    repeatedly across the analyze and optimize steps. Returns immutable
+    tuples so callers always get fresh dicts.
+    """
+    sections = []
+    line_number = 0
+    position = 0
 
-    return sections
+    for match in _SECTION_RE.finditer(text):
+        line_number += text.count("\n", position, match.start())
+        position = match.start()
+        # Keep original casing for the name
+        sections.append((match.group().strip(), match.lastgroup, line_number))
+
+    return tuple(sections)
 
 
 def extract_experience_bullets(text: str) -> List[str]:
@@ -489,34 +839,84 @@ def count_bullets_per_section(text: str) -> Dict[str, int]:
 # ---------------- FILE SAVING ----------------------------
 # =========================================================
 
-def save_extracted_text_to_file(text: str) -> Optional[str]:
+def save_extracted_text(text: str) -> Optional[str]:
+    """
+    Persist extracted text to the project base file, then copy that file to
+    a temporary debug file instead of encoding and writing the text twice.
+    """
+    base_path = save_extracted_text_to_project_base(text)
+    return save_extracted_text_to_file(text, source_path=base_path)
+
+
+# Debug copies of extracted text rotate through a fixed set of slots in the
+# temp directory instead of leaving a new file behind for every upload
+_DEBUG_TEXT_SLOTS = 32
+_DEBUG_TEXT_NAME_FMT = "extractedText_%02d.txt"
+_debug_text_counter = itertools.count()
+
+
+def save_extracted_text_to_file(text: str, source_path: Optional[str] = None) -> Optional[str]:
     """
     Save extracted text to temporary file for debugging.
+    When source_path already holds the same text, it is copied instead.
     """
     try:
-        tmp = tempfile.NamedTemporaryFile(
-            delete=False,
-            suffix=".txt",
-            mode="w",
-            encoding="utf-8"
-        )
-        tmp.write(text)
-        tmp.close()
-        return tmp.name
+        slot = next(_debug_text_counter) % _DEBUG_TEXT_SLOTS
+        debug_dir = Path(tempfile.gettempdir())
+        path = debug_dir / (_DEBUG_TEXT_NAME_FMT % slot)
+
+        fd, tmp_name = tempfile.mkstemp(dir=debug_dir, suffix=".tmp")
+        try:
+            if source_path is not None:
+                os.close(fd)
+                shutil.copyfile(source_path, tmp_name)
+            else:
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                    tmp.write(text)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        return str(path)
     except Exception as e:
         return None
 
-def save_extracted_text_to_project_base(text: str) -> None:
+_RESUME_DIR = Path(__file__).resolve().parent.parent.parent / "resume"
+
+
+@lru_cache(maxsize=None)
+def _resume_dir() -> Path:
+    """
+    Return the project resume directory, creating it on first use only.
+    A failed mkdir is not cached, so it is retried on the next call.
+    """
+    _RESUME_DIR.mkdir(exist_ok=True)
+    return _RESUME_DIR
+
+
+def save_extracted_text_to_project_base(text: str) -> Optional[str]:
     """
     Save extracted text to project directory for reference.
     """
     try:
-        base = Path(__file__).parent.parent.parent / "resume"
-        base.mkdir(exist_ok=True)
-        path = base / "baseResume.txt"
+        path = _resume_dir() / "baseResume.txt"
         path.write_text(text, encoding="utf-8")
+        return str(path)
     except Exception as e:
-        pass
+        return None
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write every byte of data to fd. os.write may write only part of the
+    buffer (e.g. when the disk fills up), so keep going until it is drained.
+    """
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        if not written:
+            raise OSError("write returned 0 bytes")
+        view = view[written:]
 
 
 def save_optimized_resume_to_file(text: str) -> Optional[str]:
@@ -524,15 +924,45 @@ def save_optimized_resume_to_file(text: str) -> Optional[str]:
     Save optimized resume to project directory.
     """
     try:
-        base = Path(__file__).parent.parent.parent / "resume"
-        base.mkdir(exist_ok=True)
-        path = base / "optimizedResume.txt"
-        path.write_text(text, encoding="utf-8")
+        path = _resume_dir() / "optimizedResume.txt"
+        # Encode once and write the bytes straight to the fd, bypassing the
+        # text and buffered I/O layers. The write goes to a unique temp file
+        # in the same directory that is then renamed over the target, so
+        # readers never see a partially written resume
+        data = text.encode("utf-8")
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            try:
+                _write_all(fd, data)
+            finally:
+                os.close(fd)
+            os.chmod(tmp_name, 0o644)  # mkstemp creates the file owner-only
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
         return str(path)
     except Exception as e:
+        # Usually runs in the background, so nobody else sees the failure
+        logger.warning("Failed to save optimized resume: %s", e)
         return None
 
 
+# Strong references to fire-and-forget tasks; the event loop only keeps weak
+# ones, so an unreferenced task could be garbage-collected mid-run
+_background_tasks: Set["asyncio.Task[Any]"] = set()
+
+
+def _run_in_background(func, *args) -> None:
+    """
+    Run a blocking function on a worker thread without awaiting it.
+    Must be called from a running event loop.
+    """
+    task = asyncio.create_task(asyncio.to_thread(func, *args))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
 # =========================================================
 # ------- SMART JD CONDENSER (prevent timeout) -----------
 # =========================================================
@@ -572,7 +1002,7 @@ def _condense_job_description(raw_jd: str) -> str:
             if not in_relevant:
                 start = i
                 in_relevant = True
-        elif in_relevant and line.strip() == '':
+        elif in_relevant and (not line or line.isspace()):
             # Blank line might be a paragraph break, keep going for a bit
             pass
         elif in_relevant and re.match(r'^[A-Z][A-Za-z\s]{2,40}:?\s*$', line.strip()):
@@ -602,6 +1032,55 @@ def _condense_job_description(raw_jd: str) -> str:
 # ---------------- RESUME ANALYSIS ------------------------
 # =========================================================
 
+# Job data fields that hold keyword/phrase lists
+_JOB_PHRASE_FIELDS = ("skills", "requirements", "technologies", "tools", "qualifications")
+
+# Punctuation stripped before word-level matching (compiled once at import)
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_SINGLE_WORD_RE = re.compile(r'\w{2,}')  # one-letter skills keep the regex path
+
+
+def _is_word_char(char: str) -> bool:
+    """Same definition of a word character as the regex \\w class."""
+    return char.isalnum() or char == '_'
+
+
+def _find_whole_phrases(phrases: Iterable[str], text: str) -> Set[str]:
+    """
+    Return the phrases that occur in text between word boundaries, i.e. those
+    for which r'\\b' + re.escape(phrase) + r'\\b' would match. Uses one
+    Aho-Corasick pass over text instead of one regex search per phrase.
+    """
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, phrase)
+    if not len(automaton):
+        return set()
+    automaton.make_automaton()
+
+    found = set()
+    for end, phrase in automaton.iter(text):
+        if phrase in found:
+            continue
+        start = end - len(phrase) + 1
+        before = start > 0 and _is_word_char(text[start - 1])
+        after = end + 1 < len(text) and _is_word_char(text[end + 1])
+        if _is_word_char(phrase[0]) != before and _is_word_char(phrase[-1]) != after:
+            found.add(phrase)
+    return found
+
+
+@lru_cache(maxsize=8)
+def _tokenize_resume(resume_text: str) -> Tuple[str, FrozenSet[str]]:
+    """
+    Lower-case the resume and split it into punctuation-free words.
+    Memoized since the same resume is analyzed against several job postings.
+    """
+    resume_lower = resume_text.lower()
+    resume_normalized = _PUNCTUATION_RE.sub(' ', resume_lower)  # Remove punctuation
+    return resume_lower, frozenset(resume_normalized.split())
+
+
 async def analyze_resume_against_job(resume_text: str, job_data: Dict) -> Dict[str, Any]:
     """
     Compare resume against job description to identify missing and matching keywords.
@@ -610,18 +1089,24 @@ async def analyze_resume_against_job(resume_text: str, job_data: Dict) -> Dict[s
     # Check cache first
     cache_key = _generate_cache_key(resume_text, job_data)
 
-    if cache_key in _analysis_cache:
-        print("Cache hit for analysis")
-        return _analysis_cache[cache_key]
+    cached = _cache_get(_analysis_cache, cache_key)
+    if cached is None:
+        cached = await asyncio.to_thread(_disk_cache_get, f"analysis-{cache_key}")
+        if cached is not None:
+            _cache_put(_analysis_cache, cache_key, cached)
+    if cached is not None:
+        logger.debug("Cache hit for analysis")
+        return cached
 
     # Extract all potential keywords from job description
     job_phrases = []
-    for field in ["skills", "requirements", "technologies", "tools", "qualifications"]:
-        if isinstance(job_data.get(field), list):
-            job_phrases.extend(job_data[field])
+    for field in _JOB_PHRASE_FIELDS:
+        value = job_data.get(field)
+        if isinstance(value, list):
+            job_phrases.extend(value)
 
     # Remove duplicates and clean - SORT for consistency
-    job_phrases = sorted(list(set([p.strip() for p in job_phrases if p.strip()])))
+    job_phrases = sorted({stripped for p in job_phrases if (stripped := p.strip())})
 
     if not job_phrases:
         return {
@@ -635,27 +1120,45 @@ async def analyze_resume_against_job(resume_text: str, job_data: Dict) -> Dict[s
     # Categorize keywords with improved matching logic
     missing = []
     matching = []
-    resume_lower = resume_text.lower()
-
-    # Normalize resume text for better matching
-    resume_normalized = re.sub(r'[^\w\s]', ' ', resume_lower)  # Remove punctuation
-    resume_words = set(resume_normalized.split())
+    resume_lower, resume_words = _tokenize_resume(resume_text)
 
     # Batch-load skill variations for ALL job phrases in one call
-    # This replaces N serial OpenAI calls with a single batch call
-    _batch_load_skill_variations(job_phrases)
+    # This replaces N serial OpenAI calls with a single batch call.
+    # Meanwhile, find whole-word occurrences of every phrase the set lookups
+    # below cannot decide, in a single scan of the resume on a worker thread
+    _, whole_phrases = await asyncio.gather(
+        _batch_load_skill_variations(job_phrases),
+        asyncio.to_thread(
+            _find_whole_phrases,
+            [phrase_lower for phrase in job_phrases
+             if not _SINGLE_WORD_RE.fullmatch(phrase_lower := phrase.lower())],
+            resume_lower,
+        ),
+    )
 
     for phrase in job_phrases:
         phrase_lower = phrase.lower()
-        phrase_normalized = re.sub(r'[^\w\s]', ' ', phrase_lower)
+
+        # Plain single words: resume_words holds every maximal run of word
+        # characters, so set membership gives the same answer as a
+        # word-boundary regex search without rescanning the resume
+        if _SINGLE_WORD_RE.fullmatch(phrase_lower):
+            if (phrase_lower in resume_words
+                    or (phrase_lower.endswith('s') and phrase_lower[:-1] in resume_words)
+                    or phrase_lower + 's' in resume_words
+                    or _check_skill_variations(phrase_lower, resume_lower)):
+                matching.append(phrase)
+            else:
+                missing.append(phrase)
+            continue
+
+        phrase_normalized = _PUNCTUATION_RE.sub(' ', phrase_lower)
 
         # Multi-word phrases: check for exact phrase match or word boundary match
         if ' ' in phrase_normalized:
             phrase_words = phrase_normalized.split()
             # Check exact phrase match with word boundaries
-            pattern = r'\b' + re.escape(phrase_lower.strip()) + r'\b'
-
-            if re.search(pattern, resume_lower):
+            if phrase_lower in whole_phrases:
                 matching.append(phrase)
             # Check if all words in the phrase appear in resume
             elif all(word in resume_words for word in phrase_words if len(word) > 2):
@@ -678,9 +1181,8 @@ async def analyze_resume_against_job(resume_text: str, job_data: Dict) -> Dict[s
             else:
                 missing.append(phrase)
 
-    # Sort for consistency
-    missing = sorted(missing)
-    matching = sorted(matching)
+    # missing/matching are already sorted: job_phrases was sorted above and
+    # the loop preserves its order
 
     # Use AI to filter actionable keywords from missing list
     ai_filtered = await filter_keywords_with_ai(
@@ -693,7 +1195,7 @@ async def analyze_resume_against_job(resume_text: str, job_data: Dict) -> Dict[s
     score = (len(matching) / max(len(job_phrases), 1)) * 100
 
     # Save to cache
-    _analysis_cache[cache_key] = {
+    result = {
         "success": True,
         "matchScore": round(score, 1),
         "missingPhrases": missing,
@@ -701,8 +1203,56 @@ async def analyze_resume_against_job(resume_text: str, job_data: Dict) -> Dict[s
         "actionableKeywords": ai_filtered.get("actionableKeywords", []),
         "totalKeywords": len(job_phrases)
     }
+    _cache_put(_analysis_cache, cache_key, result)
+    # Keep a degraded (non-AI) keyword list out of the persistent cache so the
+    # next upload retries OpenAI instead of serving it across restarts
+    if not ai_filtered.get("usedFallback"):
+        await asyncio.to_thread(_disk_cache_put, f"analysis-{cache_key}", result)
+
+    return result
+
+
+# Common skill variations and abbreviations across all professions
+_COMMON_SKILL_VARIATIONS: Dict[str, Tuple[str, ...]] = {
+    # Tech
+    'javascript': ('js', 'ecmascript'), 'typescript': ('ts',), 'python': ('py',),
+    'kubernetes': ('k8s',), 'artificial intelligence': ('ai',), 'machine learning': ('ml',),
+    'continuous integration': ('ci',), 'continuous delivery': ('cd',), 'ci/cd': ('cicd',),
+    'amazon web services': ('aws',), 'google cloud platform': ('gcp',),
+    'microsoft azure': ('azure',), 'structured query language': ('sql',),
+    'nosql': ('mongodb', 'dynamodb', 'cassandra'), 'react.js': ('react', 'reactjs'),
+    'node.js': ('node', 'nodejs'), 'vue.js': ('vue', 'vuejs'),
+    'next.js': ('next', 'nextjs'), 'angular.js': ('angular', 'angularjs'),
+
+    # Business
+    'search engine optimization': ('seo',), 'customer relationship management': ('crm',),
+    'return on investment': ('roi',), 'key performance indicator': ('kpi', 'kpis'),
+    'enterprise resource planning': ('erp',), 'business intelligence': ('bi',),
+
+    # Finance
+    'generally accepted accounting principles': ('gaap',), 'profit and loss': ('p&l',),
+
+    # Healthcare
+    'electronic health records': ('ehr', 'emr'), 'registered nurse': ('rn',),
+
+    # HR
+    'human resources': ('hr',), 'diversity equity and inclusion': ('dei',),
+}
 
-    return _analysis_cache[cache_key]
+# Reverse index: abbreviation -> full forms, in table order
+_SKILL_FULL_FORMS: Dict[str, Tuple[str, ...]] = {}
+for _full_form, _abbrevs in _COMMON_SKILL_VARIATIONS.items():
+    for _abbrev in _abbrevs:
+        _SKILL_FULL_FORMS[_abbrev] = _SKILL_FULL_FORMS.get(_abbrev, ()) + (_full_form,)
+del _full_form, _abbrevs, _abbrev
+
+# One precompiled word-boundary alternation per skill covering both lookup
+# directions, so the static table never goes through re's pattern cache
+_SKILL_VARIATION_RES: Dict[str, "re.Pattern[str]"] = {
+    _skill: re.compile(r'\b(?:' + '|'.join(map(re.escape, _variants)) + r')\b')
+    for _skill in _COMMON_SKILL_VARIATIONS.keys() | _SKILL_FULL_FORMS.keys()
+    if (_variants := _COMMON_SKILL_VARIATIONS.get(_skill, ()) + _SKILL_FULL_FORMS.get(_skill, ()))
+}
 
 
 def _check_skill_variations(skill: str, resume_text: str) -> bool:
@@ -710,48 +1260,13 @@ def _check_skill_variations(skill: str, resume_text: str) -> bool:
     Check for common skill variations and abbreviations across all professions.
     Uses a hardcoded lookup only — AI batch lookup happens separately.
     """
-    common_variations = {
-        # Tech
-        'javascript': ['js', 'ecmascript'], 'typescript': ['ts'], 'python': ['py'],
-        'kubernetes': ['k8s'], 'artificial intelligence': ['ai'], 'machine learning': ['ml'],
-        'continuous integration': ['ci'], 'continuous delivery': ['cd'], 'ci/cd': ['cicd'],
-        'amazon web services': ['aws'], 'google cloud platform': ['gcp'],
-        'microsoft azure': ['azure'], 'structured query language': ['sql'],
-        'nosql': ['mongodb', 'dynamodb', 'cassandra'], 'react.js': ['react', 'reactjs'],
-        'node.js': ['node', 'nodejs'], 'vue.js': ['vue', 'vuejs'],
-        'next.js': ['next', 'nextjs'], 'angular.js': ['angular', 'angularjs'],
-
-        # Business
-        'search engine optimization': ['seo'], 'customer relationship management': ['crm'],
-        'return on investment': ['roi'], 'key performance indicator': ['kpi', 'kpis'],
-        'enterprise resource planning': ['erp'], 'business intelligence': ['bi'],
-
-        # Finance
-        'generally accepted accounting principles': ['gaap'], 'profit and loss': ['p&l'],
-
-        # Healthcare
-        'electronic health records': ['ehr', 'emr'], 'registered nurse': ['rn'],
-
-        # HR
-        'human resources': ['hr'], 'diversity equity and inclusion': ['dei'],
-    }
-
     skill_lower = skill.lower().strip()
     resume_lower = resume_text.lower()
 
-    # Quick check: common variations first (no API call needed)
-    if skill_lower in common_variations:
-        for variant in common_variations[skill_lower]:
-            pattern = r'\b' + re.escape(variant) + r'\b'
-            if re.search(pattern, resume_lower):
-                return True
-
-    # Reverse lookup for common variations
-    for full_form, abbrevs in common_variations.items():
-        if skill_lower in abbrevs:
-            pattern = r'\b' + re.escape(full_form) + r'\b'
-            if re.search(pattern, resume_lower):
-                return True
+    # Quick check: common variations and their full forms (no API call needed)
+    variation_re = _SKILL_VARIATION_RES.get(skill_lower)
+    if variation_re is not None and variation_re.search(resume_lower):
+        return True
 
     # Check the batch cache (populated by _batch_check_skill_variations)
     if skill_lower in _skill_variations_cache:
@@ -767,7 +1282,7 @@ def _check_skill_variations(skill: str, resume_text: str) -> bool:
 _skill_variations_cache: Dict[str, List[str]] = {}
 
 
-def _batch_load_skill_variations(skills: List[str]) -> None:
+async def _batch_load_skill_variations(skills: List[str]) -> None:
     """
     Batch-fetch variations for multiple skills in ONE OpenAI call.
     Replaces the old per-skill serial approach that caused timeouts.
@@ -780,7 +1295,7 @@ def _batch_load_skill_variations(skills: List[str]) -> None:
     # Limit batch size to keep prompt reasonable
     batch = uncached[:30]
 
-    client = _get_openai_client()
+    client = _get_async_openai_client()
     try:
         prompt = (
             "For each skill below, list its common abbreviations and alternative names.\n"
@@ -789,7 +1304,7 @@ def _batch_load_skill_variations(skills: List[str]) -> None:
             "Skills:\n" + "\n".join(f"- {s}" for s in batch)
         )
 
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=settings.openai_model or "gpt-4o-mini",
             messages=[
                 {"role": "system", "content": "Return ONLY valid JSON, no markdown."},
@@ -801,7 +1316,7 @@ def _batch_load_skill_variations(skills: List[str]) -> None:
 
         content = response.choices[0].message.content.strip()
         content = re.sub(r"^```(?:json)?|```$", "", content, flags=re.MULTILINE).strip()
-        mapping = json.loads(content)
+        mapping = _loads(content)
 
         if isinstance(mapping, dict):
             for skill, variants in mapping.items():
@@ -809,7 +1324,7 @@ def _batch_load_skill_variations(skills: List[str]) -> None:
                     _skill_variations_cache[skill.lower().strip()] = variants
 
     except Exception as e:
-        print(f"Batch skill variation lookup error: {e}")
+        logger.warning("Batch skill variation lookup error: %s", e)
         # On failure, cache empty lists so we don't retry
         for s in batch:
             _skill_variations_cache[s.lower().strip()] = []
@@ -819,39 +1334,40 @@ def _batch_load_skill_variations(skills: List[str]) -> None:
 # ---------------- KEYWORD FILTERING ---------------------
 # =========================================================
 
+# Maximum number of missing phrases sent to the AI keyword filter
+_MAX_KEYWORDS_FOR_AI = 40
+
+# Requirements a candidate cannot act on by editing their resume, fused into
+# one pattern so each phrase is searched once
+_NON_ACTIONABLE_RE = re.compile('|'.join(f'(?:{p})' for p in (
+    r'\d+\+?\s*years?',  # "5+ years", "3 years"
+    r'years?\s+of\s+experience',  # "years of experience"
+    r'bachelor[\'"]?s?\s+degree',  # "Bachelor's degree"
+    r'master[\'"]?s?\s+degree',  # "Master's degree"
+    r'phd',  # PhD
+    r'doctorate',  # Doctorate
+    r'security\s+clearance',  # Security clearance
+    r'ability\s+to\s+travel',  # Ability to travel
+    r'willing\s+to\s+relocate',  # Willing to relocate
+    r'work\s+independently',  # Work independently
+    r'team\s+player',  # Team player
+    r'strong\s+communication',  # Strong communication
+    r'certified\s+\w+',  # Certified X (e.g., Certified Public Accountant)
+    r'\w+\s+certification',  # X certification
+)), re.IGNORECASE)
+
+
 def _basic_keyword_filter(missing_phrases: List[str]) -> Dict[str, Any]:
     """
     Basic keyword filter fallback when AI is unavailable.
     Filters out obvious non-actionable items like years of experience, degrees, etc.
+    The result carries usedFallback so callers don't persist it as an AI answer.
     """
-    non_actionable_patterns = [
-        r'\d+\+?\s*years?',  # "5+ years", "3 years"
-        r'years?\s+of\s+experience',  # "years of experience"
-        r'bachelor[\'"]?s?\s+degree',  # "Bachelor's degree"
-        r'master[\'"]?s?\s+degree',  # "Master's degree"
-        r'phd',  # PhD
-        r'doctorate',  # Doctorate
-        r'security\s+clearance',  # Security clearance
-        r'ability\s+to\s+travel',  # Ability to travel
-        r'willing\s+to\s+relocate',  # Willing to relocate
-        r'work\s+independently',  # Work independently
-        r'team\s+player',  # Team player
-        r'strong\s+communication',  # Strong communication
-        r'certified\s+\w+',  # Certified X (e.g., Certified Public Accountant)
-        r'\w+\s+certification',  # X certification
-    ]
-
     actionable_keywords = []
 
     for phrase in missing_phrases:
         # Skip if matches non-actionable patterns
-        is_non_actionable = False
-        phrase_lower = phrase.lower()
-
-        for pattern in non_actionable_patterns:
-            if re.search(pattern, phrase_lower, re.IGNORECASE):
-                is_non_actionable = True
-                break
+        is_non_actionable = bool(_NON_ACTIONABLE_RE.search(phrase.lower()))
 
         if not is_non_actionable and len(phrase.strip()) > 2:
             # Add to actionable keywords with basic metadata
@@ -862,7 +1378,7 @@ def _basic_keyword_filter(missing_phrases: List[str]) -> Dict[str, Any]:
                 "suggestedIntegration": f"Consider incorporating '{phrase}' into relevant experience bullets"
             })
 
-    return {"actionableKeywords": actionable_keywords}
+    return {"actionableKeywords": actionable_keywords, "usedFallback": True}
 
 
 async def filter_keywords_with_ai(
@@ -877,14 +1393,15 @@ async def filter_keywords_with_ai(
     # Check keyword filter cache
     keyword_cache_key = _generate_keyword_cache_key(missing_phrases, job_title)
 
-    if keyword_cache_key in _keyword_filter_cache:
-        print("Cache hit for keyword filtering")
-        return _keyword_filter_cache[keyword_cache_key]
+    cached = _cache_get(_keyword_filter_cache, keyword_cache_key)
+    if cached is not None:
+        logger.debug("Cache hit for keyword filtering")
+        return cached
 
     if not missing_phrases:
         return {"actionableKeywords": []}
 
-    client = _get_openai_client()
+    client = _get_async_openai_client()
 
     try:
         prompt = f"""
@@ -908,7 +1425,7 @@ EXCLUDE (Non-Actionable):
 ✗ Job requirements (e.g., "ability to travel", "work independently")
 
 KEYWORDS TO FILTER:
-{chr(10).join(f"- {p}" for p in missing_phrases[:40])}
+{chr(10).join(f"- {p}" for p in missing_phrases[:_MAX_KEYWORDS_FOR_AI])}
 
 Return ONLY valid JSON with this exact structure:
 {{
@@ -928,7 +1445,7 @@ Priority guidelines:
 - low: Nice-to-have skills or tangential technologies
 """
 
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=settings.openai_model or "gpt-4o-mini",
             messages=[
                 {
@@ -942,39 +1459,44 @@ Priority guidelines:
             frequency_penalty=0.0,
             presence_penalty=0.0,
             seed=12345,
-            max_tokens=1500
+            # Up to 40 keywords with integration tips need ~1 500 tokens;
+            # JSON mode turns a truncated reply into a parse failure
+            max_tokens=1500,
+            response_format={"type": "json_object"},
         )
 
+        # JSON mode guarantees a bare JSON object, no markdown fences to strip
         content = response.choices[0].message.content.strip()
-        content = re.sub(r"^```(?:json)?|```$", "", content, flags=re.MULTILINE).strip()
 
-        print(f"Raw AI response (first 500 chars): {content[:500]}")
+        # Only build the slice when the debug record will actually be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw AI response (first 500 chars): %s", content[:500])
 
         try:
-            result = json.loads(content)
+            result = _loads(content)
         except json.JSONDecodeError as e:
-            print(f"Content that failed to parse: {content[:1000]}")
+            logger.error("Content that failed to parse: %s", content[:1000])
             return _basic_keyword_filter(missing_phrases)
 
         # Validate and return actionable keywords
         actionable_keywords = result.get("actionableKeywords", [])
 
         if not isinstance(actionable_keywords, list):
-            print("ERROR: actionableKeywords is not a list")
+            logger.error("actionableKeywords is not a list")
             return _basic_keyword_filter(missing_phrases)
 
-        print(f"Successfully extracted {len(actionable_keywords)} actionable keywords")
+        logger.info("Successfully extracted %d actionable keywords", len(actionable_keywords))
 
         # Save to keyword filter cache
-        _keyword_filter_cache[keyword_cache_key] = {
+        _cache_put(_keyword_filter_cache, keyword_cache_key, {
             "actionableKeywords": actionable_keywords
-        }
+        })
 
         return {
             "actionableKeywords": actionable_keywords
         }
     except Exception as e:
-        print(f"AI keyword filtering error: {e}")
+        logger.error("AI keyword filtering error: %s", e)
         return _basic_keyword_filter(missing_phrases)
 def _dict_to_resume_text(data: Any) -> str:
     """
@@ -1020,6 +1542,17 @@ def _dict_to_resume_text(data: Any) -> str:
 # ---------------- RESUME OPTIMIZATION --------------------
 # =========================================================
 
+# Shape of every failed optimization response; copied and filled in with
+# the message rather than rebuilt in each error branch
+_OPTIMIZATION_FAILURE: Dict[str, Any] = {"success": False, "optimizedResume": "", "message": ""}
+
+
+def _optimization_failure(message: str) -> Dict[str, Any]:
+    response = _OPTIMIZATION_FAILURE.copy()
+    response["message"] = message
+    return response
+
+
 async def generate_optimized_resume(
         original_resume_text: str,
         selected_keywords: List[Dict[str, str]],
@@ -1029,11 +1562,11 @@ async def generate_optimized_resume(
 ) -> Dict[str, Any]:
 
     if not selected_keywords:
-        return {"success": False, "optimizedResume": "", "message": "No keywords selected."}
+        return _optimization_failure("No keywords selected.")
 
     api_key = settings.openai_api_key or os.getenv("OPENAI_API_KEY")
     if not api_key:
-        return {"success": False, "optimizedResume": "", "message": "OpenAI API key missing."}
+        return _optimization_failure("OpenAI API key missing.")
 
     # Extract keywords with robust handling for different input formats
     keywords = []
@@ -1049,19 +1582,19 @@ async def generate_optimized_resume(
             keywords.append(str(keyword_value).strip())
 
     if not keywords:
-        return {"success": False, "optimizedResume": "", "message": "No valid keywords."}
+        return _optimization_failure("No valid keywords.")
 
     # Count sections in original
     original_sections = detect_resume_sections(original_resume_text)
-    print(f"\nSections detected in original: {[s['name'] for s in original_sections]}")
     original_bullet_count = count_bullet_points(original_resume_text)
-    print(f"Bullet points in original: {original_bullet_count}")
-    print("=" * 80)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Original resume: sections %s, %d bullet points",
+                     [s['name'] for s in original_sections], original_bullet_count)
 
-    print(f"Generating new resume with {len(keywords)} keywords")
+    logger.info("Generating new resume with %d keywords", len(keywords))
 
     try:
-        client = _get_openai_client()
+        client = _get_async_openai_client()
 
         prompt = f"""{SYSTEM_INSTRUCTIONS}
 
@@ -1092,9 +1625,11 @@ OUTPUT (valid JSON only, no markdown):
   "tips": ["Improvement 1", "Improvement 2"]
 }}"""
 
-        print("Sending comprehensive optimization request to OpenAI...")
+        logger.debug("Sending comprehensive optimization request to OpenAI...")
 
-        response = client.chat.completions.create(
+        # Stream the completion so tokens are received as they are generated
+        # instead of idling until the whole response is ready
+        stream = await client.chat.completions.create(
             model=settings.openai_model or "gpt-4o",
             messages=[{
                     "role": "system",
@@ -1125,30 +1660,38 @@ OUTPUT (valid JSON only, no markdown):
             frequency_penalty=0.0,
             presence_penalty=0.0,
             seed=54321,
-            max_tokens=16000
+            max_tokens=16000,
+            stream=True,
         )
 
-        content = response.choices[0].message.content.strip()
+        chunks = []
+        async for chunk in stream:
+            if chunk.choices and (delta := chunk.choices[0].delta.content):
+                chunks.append(delta)
+
+        content = "".join(chunks).strip()
         content = re.sub(r"^```(?:json)?|```$", "", content, flags=re.MULTILINE).strip()
 
         try:
-            result = json.loads(content)
+            result = _loads(content)
         except json.JSONDecodeError as e:
-            print(f"JSON parse error: {e}")
-            print(f"Content that failed to parse: {content[:500]}")
-            return {"success": False, "optimizedResume": "", "message": "AI returned invalid JSON."}
+            logger.error("JSON parse error: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Content that failed to parse: %s", content[:500])
+            return _optimization_failure("AI returned invalid JSON.")
 
         optimized_text = result.get("optimizedResume", "")
 
         if isinstance(optimized_text, dict):
-            print(f"WARNING: optimizedResume is a dict with keys: {list(optimized_text.keys())}")
-            print(f"Dict content preview: {str(optimized_text)[:500]}")
+            logger.warning("optimizedResume is a dict with keys: %s", list(optimized_text.keys()))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Dict content preview: %s", str(optimized_text)[:500])
         elif isinstance(optimized_text, list):
-            print(f"WARNING: optimizedResume is a list with {len(optimized_text)} items")
-            print(f"List content preview: {str(optimized_text)[:500]}")
+            logger.warning("optimizedResume is a list with %d items", len(optimized_text))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("List content preview: %s", str(optimized_text)[:500])
         else:
-            print(f"optimizedResume length before conversion: {len(str(optimized_text))} characters")
-        print("=" * 80)
+            logger.debug("optimizedResume length before conversion: %d characters", len(str(optimized_text)))
 
         # Check if optimizedResume is a dict/list (meaning AI returned wrong format)
         if isinstance(optimized_text, (dict, list)):
@@ -1156,45 +1699,50 @@ OUTPUT (valid JSON only, no markdown):
             optimized_text = _dict_to_resume_text(optimized_text)
 
         if not optimized_text:
-            print("ERROR: No optimized_text extracted from AI response")
-            return {"success": False, "optimizedResume": "", "message": "No resume generated."}
+            logger.error("No optimized_text extracted from AI response")
+            return _optimization_failure("No resume generated.")
 
         if not isinstance(optimized_text, str):
             optimized_text = str(optimized_text)
 
-        print(f"Extracted resume text length: {len(optimized_text)} characters")
-        print(f"Extracted resume line count: {len(optimized_text.splitlines())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Count newlines directly rather than materializing a list of lines
+            line_count = optimized_text.count("\n") + (not optimized_text.endswith("\n"))
+            logger.debug("Extracted resume text: %d characters, %d lines", len(optimized_text), line_count)
 
         # Clean encoding artifacts from the generated resume
         optimized_text = clean_encoding_artifacts(optimized_text)
 
         # Check sections in optimized
         optimized_sections = detect_resume_sections(optimized_text)
-        print(f"\nSections detected in optimized: {[s['name'] for s in optimized_sections]}")
         optimized_bullet_count = count_bullet_points(optimized_text)
-        print(f"Bullet points in optimized: {optimized_bullet_count}")
 
         # Compare
-        print(f"\nCOMPARISON:")
-        print(f"  Original bullets: {original_bullet_count} → Optimized bullets: {optimized_bullet_count}")
-        print(f"  Original sections: {len(original_sections)} → Optimized sections: {len(optimized_sections)}")
-        print(f"  Original length: {len(original_resume_text)} → Optimized length: {len(optimized_text)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Optimized resume: sections %s; original → optimized: "
+                "bullets %d → %d, sections %d → %d, length %d → %d",
+                [s['name'] for s in optimized_sections],
+                original_bullet_count, optimized_bullet_count,
+                len(original_sections), len(optimized_sections),
+                len(original_resume_text), len(optimized_text),
+            )
 
         # WARN if content was significantly reduced
-        if len(optimized_text) < len(original_resume_text) * 0.8:
-            print(f"⚠️  WARNING: Optimized resume is {len(original_resume_text) - len(optimized_text)} characters shorter!")
-            print(f"⚠️  This suggests the AI may have omitted content from the original resume.")
+        # Integer form of len(optimized) < 0.8 * len(original)
+        if 5 * len(optimized_text) < 4 * len(original_resume_text):
+            logger.warning("Optimized resume is %d characters shorter; the AI may have omitted "
+                           "content from the original resume.", len(original_resume_text) - len(optimized_text))
 
         if optimized_bullet_count < original_bullet_count:
-            print(f"⚠️  WARNING: Optimized resume has {original_bullet_count - optimized_bullet_count} fewer bullet points!")
-            print(f"⚠️  Some experiences or achievements may have been omitted.")
-
-        print("=" * 80)
+            logger.warning("Optimized resume has %d fewer bullet points; some experiences or "
+                           "achievements may have been omitted.", original_bullet_count - optimized_bullet_count)
 
         keyword_check = verify_keyword_integration(optimized_text, keywords)
-        save_optimized_resume_to_file(optimized_text)
+        # Nothing in the response depends on the saved copy
+        _run_in_background(save_optimized_resume_to_file, optimized_text)
 
-        print(f"Success! {len(keyword_check['integrated'])} keywords integrated")
+        logger.info("Success! %d keywords integrated", len(keyword_check['integrated']))
 
         # Create job_data from job_description and selected_keywords for ATS score calculation
         job_data = {
@@ -1228,7 +1776,9 @@ OUTPUT (valid JSON only, no markdown):
             optimized_text=optimized_text,
             original_text=original_resume_text,
             job_data=job_data,
-            keyword_verification=keyword_check
+            keyword_verification=keyword_check,
+            original_bullets=original_bullet_count,
+            optimized_bullets=optimized_bullet_count,
         )
 
         # Count how many resume sections contain at least one integrated keyword
@@ -1257,10 +1807,8 @@ OUTPUT (valid JSON only, no markdown):
         }
 
     except Exception as e:
-        import traceback
-        print(f"Generation error: {e}")
-        print(f"Error traceback: {traceback.format_exc()}")
-        return {"success": False, "optimizedResume": "", "message": f"Generation failed: {str(e)}"}
+        logger.exception("Generation error: %s", e)
+        return _optimization_failure(f"Generation failed: {str(e)}")
 
 
 # =========================================================
@@ -1543,7 +2091,7 @@ ANALYSIS RULES:
 
         content = response.choices[0].message.content.strip()
         content = re.sub(r"^```(?:json)?|```$", "", content, flags=re.MULTILINE).strip()
-        result = json.loads(content)
+        result = _loads(content)
 
         if not isinstance(result, dict):
             return {"flags": [], "positives": [], "questionsToAsk": [], "summary": ""}
@@ -1551,7 +2099,7 @@ ANALYSIS RULES:
         return result
 
     except Exception as e:
-        print(f"AI red flag analysis error: {e}")
+        logger.error("AI red flag analysis error: %s", e)
         return {"flags": [], "positives": [], "questionsToAsk": [], "summary": "Could not complete AI analysis."}
 
 
@@ -1647,9 +2195,7 @@ OUTPUT: Return ONLY the plain text cover letter, nothing else."""
         }
 
     except Exception as e:
-        import traceback
-        print(f"Cover letter generation error: {e}")
-        print(f"Error traceback: {traceback.format_exc()}")
+        logger.exception("Cover letter generation error: %s", e)
         return {"success": False, "coverLetter": "", "message": f"Generation failed: {str(e)}"}
 
 
@@ -1694,7 +2240,9 @@ def calculate_ats_score(
     optimized_text: str,
     original_text: str,
     job_data: Dict,
-    keyword_verification: Dict[str, Any]
+    keyword_verification: Dict[str, Any],
+    original_bullets: Optional[int] = None,
+    optimized_bullets: Optional[int] = None,
 ) -> int:
     """
     Calculate accurate ATS score based on multiple factors:
@@ -1702,6 +2250,7 @@ def calculate_ats_score(
     - Job requirements match (30% weight)
     - Resume completeness (20% weight)
     - Formatting quality (10% weight)
+    Bullet counts are computed from the texts unless passed in.
     """
     score = 0
 
@@ -1712,11 +2261,12 @@ def calculate_ats_score(
 
     # Factor 2: Job Requirements Match (30 points max)
     job_phrases = []
-    for field in ["skills", "requirements", "technologies", "tools", "qualifications"]:
-        if isinstance(job_data.get(field), list):
-            job_phrases.extend(job_data[field])
+    for field in _JOB_PHRASE_FIELDS:
+        value = job_data.get(field)
+        if isinstance(value, list):
+            job_phrases.extend(value)
 
-    job_phrases = list(set([p.strip() for p in job_phrases if p.strip()]))
+    job_phrases = list({stripped for p in job_phrases if (stripped := p.strip())})
 
     requirements_score = 0
     if job_phrases:
@@ -1742,8 +2292,10 @@ def calculate_ats_score(
     # Factor 3: Resume Completeness (20 points max)
     original_sections = detect_resume_sections(original_text)
     optimized_sections = detect_resume_sections(optimized_text)
-    original_bullets = count_bullet_points(original_text)
-    optimized_bullets = count_bullet_points(optimized_text)
+    if original_bullets is None:
+        original_bullets = count_bullet_points(original_text)
+    if optimized_bullets is None:
+        optimized_bullets = count_bullet_points(optimized_text)
 
     completeness_score = 0
 
@@ -1861,7 +2413,7 @@ Return ONLY valid JSON (no markdown fences):
 
         content = response.choices[0].message.content.strip()
         content = re.sub(r"^```(?:json)?|```$", "", content, flags=re.MULTILINE).strip()
-        questions = json.loads(content)
+        questions = _loads(content)
 
         if not isinstance(questions, list):
             return {"success": False, "questions": [], "message": "Unexpected AI response format."}
@@ -1869,7 +2421,7 @@ Return ONLY valid JSON (no markdown fences):
         return {"success": True, "questions": questions}
 
     except Exception as e:
-        print(f"Interview question generation error: {e}")
+        logger.error("Interview question generation error: %s", e)
         return {"success": False, "questions": [], "message": f"Generation failed: {str(e)}"}
 
 
@@ -1949,7 +2501,7 @@ Return ONLY valid JSON (no markdown fences):
 
         content = response.choices[0].message.content.strip()
         content = re.sub(r"^```(?:json)?|```$", "", content, flags=re.MULTILINE).strip()
-        feedback = json.loads(content)
+        feedback = _loads(content)
 
         if not isinstance(feedback, dict):
             return {"success": False, "feedback": None, "message": "Unexpected AI response format."}
@@ -1957,5 +2509,5 @@ Return ONLY valid JSON (no markdown fences):
         return {"success": True, "feedback": feedback}
 
     except Exception as e:
-        print(f"Interview answer evaluation error: {e}")
+        logger.error("Interview answer evaluation error: %s", e)
         return {"success": False, "feedback": None, "message": f"Evaluation failed: {str(e)}"}
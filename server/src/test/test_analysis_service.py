@@ -0,0 +1,228 @@
+"""
+Unit tests for the caching, phrase-matching and section-detection helpers in
+src/services/analysis_service.py. No external API calls are made.
+"""
+import sys
+import asyncio
+import json
+import os
+import stat
+from collections import OrderedDict
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+import pytest
+
+from src.services.analysis_service import (
+    _cache_get,
+    _cache_put,
+    _disk_cache_get,
+    _disk_cache_put,
+    _extract_pdf_text_layer,
+    _find_whole_phrases,
+    _write_all,
+    detect_resume_sections,
+)
+import src.services.analysis_service as analysis_service
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# _cache_get / _cache_put
+# ─────────────────────────────────────────────────────────────────────────────
+class TestLruCache:
+    def test_get_returns_none_for_missing_key(self):
+        assert _cache_get(OrderedDict(), "missing") is None
+
+    def test_put_then_get_returns_value(self):
+        cache = OrderedDict()
+        _cache_put(cache, "k", {"v": 1})
+        assert _cache_get(cache, "k") == {"v": 1}
+
+    def test_evicts_least_recently_used_entry(self, monkeypatch):
+        monkeypatch.setattr(analysis_service, "_CACHE_MAX_ENTRIES", 2)
+        cache = OrderedDict()
+        _cache_put(cache, "a", 1)
+        _cache_put(cache, "b", 2)
+        _cache_get(cache, "a")  # "b" is now least recently used
+        _cache_put(cache, "c", 3)
+        assert list(cache) == ["a", "c"]
+
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# _disk_cache_get / _disk_cache_put
+# ─────────────────────────────────────────────────────────────────────────────
+class TestDiskCache:
+    def test_get_returns_none_for_missing_key(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(analysis_service, "_CACHE_DIR", tmp_path)
+        assert _disk_cache_get("missing") is None
+
+    def test_put_then_get_round_trips(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(analysis_service, "_CACHE_DIR", tmp_path / "cache")
+        _disk_cache_put("k", {"text": "hello", "formatting": {"bulletCount": 2}})
+        assert _disk_cache_get("k") == {"text": "hello", "formatting": {"bulletCount": 2}}
+
+    def test_corrupt_entry_is_treated_as_miss(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(analysis_service, "_CACHE_DIR", tmp_path)
+        (tmp_path / "bad.json").write_text("{not json")
+        assert _disk_cache_get("bad") is None
+
+    def test_entries_are_private(self, monkeypatch, tmp_path):
+        cache_dir = tmp_path / "cache"
+        monkeypatch.setattr(analysis_service, "_CACHE_DIR", cache_dir)
+        _disk_cache_put("k", {"text": "hello"})
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
+        assert stat.S_IMODE(os.stat(cache_dir / "k.json").st_mode) == 0o600
+        assert [p.name for p in cache_dir.iterdir()] == ["k.json"]
+
+    def test_oldest_entries_evicted_beyond_cap(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(analysis_service, "_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(analysis_service, "_DISK_CACHE_MAX_ENTRIES", 2)
+        for i, key in enumerate(["a", "b", "c"]):
+            _disk_cache_put(key, {"i": i})
+            os.utime(tmp_path / f"{key}.json", (i, i))
+        _disk_cache_put("c", {"i": 2})
+        assert _disk_cache_get("a") is None
+        assert _disk_cache_get("b") == {"i": 1}
+        assert _disk_cache_get("c") == {"i": 2}
+
+    def test_zero_cap_disables_cache(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(analysis_service, "_CACHE_DIR", tmp_path / "cache")
+        monkeypatch.setattr(analysis_service, "_DISK_CACHE_MAX_ENTRIES", 0)
+        _disk_cache_put("k", {"text": "hello"})
+        assert not (tmp_path / "cache").exists()
+        assert _disk_cache_get("k") is None
+
+    def test_fallback_keyword_filter_is_not_persisted(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(analysis_service, "_CACHE_DIR", tmp_path)
+        monkeypatch.setattr(analysis_service, "_analysis_cache", OrderedDict())
+
+        async def no_variations(skills):
+            return None
+
+        async def fallback_filter(missing, job_title, resume_text):
+            return analysis_service._basic_keyword_filter(missing)
+
+        monkeypatch.setattr(analysis_service, "_batch_load_skill_variations", no_variations)
+        monkeypatch.setattr(analysis_service, "filter_keywords_with_ai", fallback_filter)
+        result = asyncio.run(analysis_service.analyze_resume_against_job(
+            "Python developer", {"title": "Engineer", "skills": ["Python", "Kubernetes"]}
+        ))
+        assert result["missingPhrases"] == ["Kubernetes"]
+        assert list(tmp_path.iterdir()) == []
+
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# _find_whole_phrases
+# ─────────────────────────────────────────────────────────────────────────────
+class TestFindWholePhrases:
+    def test_finds_phrase_between_word_boundaries(self):
+        assert _find_whole_phrases(["machine learning"], "applied machine learning daily") == {"machine learning"}
+
+    def test_ignores_phrase_inside_longer_word(self):
+        assert _find_whole_phrases(["data base"], "metadata based systems") == set()
+
+    def test_phrase_with_symbols(self):
+        text = "skills: c++, node.js"
+        assert _find_whole_phrases(["c++", "node.js", "ci/cd"], text) == {"node.js"}
+
+    def test_empty_phrase_list(self):
+        assert _find_whole_phrases([], "anything") == set()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# _extract_pdf_text_layer
+# ─────────────────────────────────────────────────────────────────────────────
+class TestExtractPdfTextLayer:
+    def test_pdfium_runs_under_lock_and_falls_back_to_pypdf2(self, monkeypatch):
+        lock_held = []
+
+        def unreadable(pdf_buffer):
+            lock_held.append(analysis_service._PDFIUM_LOCK.locked())
+            raise analysis_service.pdfium.PdfiumError("cannot open")
+
+        page = SimpleNamespace(extract_text=lambda: "page one")
+        monkeypatch.setattr(analysis_service.pdfium, "PdfDocument", unreadable)
+        monkeypatch.setattr(analysis_service.PyPDF2, "PdfReader", lambda stream: SimpleNamespace(pages=[page]))
+
+        assert _extract_pdf_text_layer(b"%PDF-1.4") == "page one"
+        assert lock_held == [True]
+        assert not analysis_service._PDFIUM_LOCK.locked()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# _write_all
+# ─────────────────────────────────────────────────────────────────────────────
+class TestWriteAll:
+    def test_retries_short_writes_until_all_bytes_written(self, monkeypatch, tmp_path):
+        real_write = os.write
+        monkeypatch.setattr(analysis_service.os, "write", lambda fd, buf: real_write(fd, bytes(buf[:3])))
+        path = tmp_path / "out.txt"
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+        try:
+            _write_all(fd, "résumé text".encode("utf-8"))
+        finally:
+            os.close(fd)
+        assert path.read_text(encoding="utf-8") == "résumé text"
+
+    def test_zero_byte_write_raises(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(analysis_service.os, "write", lambda fd, buf: 0)
+        with pytest.raises(OSError):
+            _write_all(0, b"data")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# detect_resume_sections
+# ─────────────────────────────────────────────────────────────────────────────
+class TestDetectResumeSections:
+    def test_ligature_headers_keep_original_text(self):
+        sections = detect_resume_sections("Proﬁle\nJane Doe\nCertiﬁcations\nAWS")
+        assert sections == [
+            {"name": "Proﬁle", "type": "summary", "lineNumber": 0},
+            {"name": "Certiﬁcations", "type": "certifications", "lineNumber": 2},
+        ]
+
+    def test_padded_headers_are_detected(self):
+        text = "Jane Doe\n   SKILLS   \nPython\n\tEducation \r\nBSc"
+        sections = detect_resume_sections(text)
+        assert sections == [
+            {"name": "SKILLS", "type": "skills", "lineNumber": 1},
+            {"name": "Education", "type": "education", "lineNumber": 3},
+        ]
+
+    def test_header_words_inside_a_line_are_not_headers(self):
+        text = "Skills include Python\nWORK  EXPERIENCE\nEducation: BSc"
+        assert detect_resume_sections(text) == []
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# filter_keywords_with_ai
+# ─────────────────────────────────────────────────────────────────────────────
+class TestFilterKeywordsWithAi:
+    def test_uses_parsed_ai_response(self, monkeypatch):
+        ai_keywords = [{
+            "keyword": "Kubernetes",
+            "category": "Tool",
+            "priority": "high",
+            "suggestedIntegration": "Mention the clusters you deployed to",
+        }]
+        calls = []
+
+        async def create(**kwargs):
+            calls.append(kwargs)
+            message = SimpleNamespace(content=json.dumps({"actionableKeywords": ai_keywords}))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        monkeypatch.setattr(analysis_service, "_get_async_openai_client", lambda: client)
+        monkeypatch.setattr(analysis_service, "_keyword_filter_cache", OrderedDict())
+
+        result = asyncio.run(analysis_service.filter_keywords_with_ai(
+            ["Kubernetes", "5+ years of experience", "Terraform"], "Engineer"
+        ))
+
+        assert len(calls) == 1
+        assert result == {"actionableKeywords": ai_keywords}
+        assert "usedFallback" not in result
@@ -17,6 +17,7 @@ from src.controllers.AnalyzeController import (
     KeywordAnalysisRequest,
     ResumeOptimizationRequest,
 )
+from src.services.analysis_service import save_extracted_text
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -111,6 +112,25 @@ class TestExtractTextFromResume:
         assert "text" in result
         assert "textLength" in result
 
+    @pytest.mark.asyncio
+    async def test_extracted_text_saved_in_background(self):
+        controller = AnalyzeController()
+        mock_file = make_upload_file(filename="resume.pdf")
+        background_tasks = MagicMock()
+
+        with patch(
+            "src.controllers.AnalyzeController.extract_text_from_pdf",
+            new_callable=AsyncMock,
+            return_value=MOCK_EXTRACTED,
+        ):
+            await controller.extract_text_from_resume(
+                resume=mock_file, background_tasks=background_tasks
+            )
+
+        background_tasks.add_task.assert_called_once_with(
+            save_extracted_text, MOCK_EXTRACTED["text"]
+        )
+
     @pytest.mark.asyncio
     async def test_service_exception_raises_500(self):
         controller = AnalyzeController()